@@ -42,6 +42,21 @@ app = Flask(__name__)
 CORS(app, supports_credentials=True)  # Enable CORS with credentials support
 db = Database()
 
+def get_requested_fields():
+    """Returns the columns requested via ?fields=a,b,c, or None for all of them."""
+    fields = request.args.get('fields')
+    if not fields:
+        return None
+    return [f.strip() for f in fields.split(',') if f.strip()]
+
+def list_response(data):
+    """Builds a list endpoint response from a JSON array string.
+
+    Keys are sorted like jsonify's, so the body is the same JSON the
+    dict-based response produced.
+    """
+    return app.response_class('{"data":' + data + ',"success":true}', mimetype='application/json')
+
 # Authentication routes
 @app.route('/api/auth/login', methods=['POST'])
 def login():
@@ -148,16 +163,18 @@ def get_qr_code(timestamp):
 @app.route('/api/qr-codes', methods=['GET'])
 def get_all_qr_codes():
     try:
-        qr_codes = db.get_all_qr_codes()
-        return jsonify({'success': True, 'data': qr_codes}), 200
+        qr_codes = db.get_all_qr_codes(get_requested_fields(), as_json=True)
+        return list_response(qr_codes), 200
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 400
 
 @app.route('/api/qr-codes/<int:timestamp>/inspections', methods=['GET'])
 def get_qr_inspections(timestamp):
     try:
-        inspections = db.get_inspections_for_qr(timestamp)
-        return jsonify({'success': True, 'data': inspections}), 200
+        inspections = db.get_inspections_for_qr(timestamp, get_requested_fields(), as_json=True)
+        return list_response(inspections), 200
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         print(f"Error fetching inspections: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -165,8 +182,10 @@ def get_qr_inspections(timestamp):
 @app.route('/api/inspections', methods=['GET'])
 def get_all_inspections():
     try:
-        inspections = db.get_all_inspections()
-        return jsonify({'success': True, 'data': inspections}), 200
+        inspections = db.get_all_inspections(get_requested_fields(), as_json=True)
+        return list_response(inspections), 200
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         print(f"Error fetching all inspections: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -198,8 +217,10 @@ def create_data_request():
 @app.route('/api/requests', methods=['GET'])
 def get_pending_requests():
     try:
-        requests = db.get_pending_requests()
-        return jsonify({'success': True, 'data': requests}), 200
+        requests = db.get_pending_requests(get_requested_fields(), as_json=True)
+        return list_response(requests), 200
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         print(f"Error fetching pending requests: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -241,8 +262,8 @@ def resolve_request(request_id):
 def get_all_users():
     # In a real app, you'd add role-based authentication here
     try:
-        users = db.get_all_users()
-        return jsonify({'success': True, 'data': users}), 200
+        users = db.get_all_users(get_requested_fields(), as_json=True)
+        return list_response(users), 200
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 400
 
@@ -281,7 +302,7 @@ def get_warranty_months(warranty_period_str):
 def get_dashboard_overview():
     try:
         all_qr_codes = db.get_all_qr_codes()
-        all_inspections = db.get_all_inspections()
+        all_inspections = db.get_all_inspections(['need_replacement_repair', 'item_type', 'lot_number'])
 
         # --- Calculate Stats ---
         total_items = len(all_qr_codes)
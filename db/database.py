@@ -2,6 +2,89 @@ import sqlite3
 import time
 from datetime import datetime
 
+# Columns each list endpoint can return, mapped to the SQL expression that
+# produces them. Also used to validate the `fields` projection parameter.
+QR_CODE_FIELDS = {
+    'timestamp': 'timestamp',
+    'vendor_name': 'vendor_name',
+    'lot_number': 'lot_number',
+    'item_type': 'item_type',
+    'manufacture_date': 'manufacture_date',
+    'supply_date': 'supply_date',
+    'warranty_period': 'warranty_period',
+    'status': 'status',
+    'created_at': 'created_at',
+    'qr_file_path': 'qr_file_path'
+}
+
+PENDING_REQUEST_FIELDS = {
+    'id': 'dr.id',
+    'qr_timestamp': 'dr.qr_timestamp',
+    'user_id': 'dr.user_id',
+    'request_type': 'dr.request_type',
+    'request_data': 'dr.request_data',
+    'status': 'dr.status',
+    'created_at': 'dr.created_at',
+    'resolved_at': 'dr.resolved_at',
+    'resolved_by': 'dr.resolved_by',
+    'username': 'u.username',
+    'item_type': 'qc.item_type',
+    'lot_number': 'qc.lot_number'
+}
+
+QR_INSPECTION_FIELDS = {
+    'id': 'id',
+    'qr_timestamp': 'qr_timestamp',
+    'inspection_time': 'inspection_time',
+    'inspection_report': 'inspection_report',
+    'need_replacement_repair': 'need_replacement_repair',
+    'created_at': 'created_at'
+}
+
+INSPECTION_FIELDS = {
+    'id': 'i.id',
+    'qr_timestamp': 'i.qr_timestamp',
+    'inspection_time': 'i.inspection_time',
+    'inspection_report': 'i.inspection_report',
+    'need_replacement_repair': 'i.need_replacement_repair',
+    'item_type': 'qc.item_type',
+    'lot_number': 'qc.lot_number'
+}
+
+USER_FIELDS = {
+    'id': 'id',
+    'username': 'username',
+    'role': 'role',
+    'created_at': 'created_at'
+}
+
+
+def select_columns(allowed, fields=None, as_json=False):
+    """Builds the SELECT column list for the requested fields.
+
+    Only names from `allowed` ever reach the SQL, so unknown fields raise
+    ValueError instead of being interpolated into the query. Fields are
+    de-duplicated and sorted, matching the key order Flask's jsonify uses.
+    With `as_json` the columns are wrapped in a single json_object() so
+    SQLite encodes each row itself.
+    """
+    if not fields:
+        fields = allowed.keys()
+    unknown = [f for f in fields if f not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    fields = sorted(set(fields))
+    if as_json:
+        return 'json_object({})'.format(', '.join(f"'{f}', {allowed[f]}" for f in fields))
+    return ', '.join(f'{allowed[f]} AS {f}' for f in fields)
+
+
+def fetch_dicts(cursor):
+    """Returns the remaining rows of `cursor` as dicts keyed by column name."""
+    names = [col[0] for col in cursor.description]
+    return [dict(zip(names, row)) for row in cursor]
+
+
 class Database:
     def __init__(self, db_file="qrix.db"):
         self.db_file = db_file
@@ -11,6 +94,22 @@ class Database:
         # Returns a connection object that can be used with a 'with' statement
         return sqlite3.connect(self.db_file)
 
+    def fetch_json(self, query, params=()):
+        """Runs a json_object() query and returns the rows as a JSON array string.
+
+        SQLite encodes each row, so no dict is built per row. All rows are
+        read before returning, so the connection is closed before the
+        response is sent and writers are never blocked by a slow client.
+        """
+        conn = self.connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+        finally:
+            conn.close()
+        return '[' + ','.join([row[0] for row in rows]) + ']'
+
     def init_db(self):
         with sqlite3.connect(self.db_file) as conn:
             cursor = conn.cursor()
@@ -188,32 +287,22 @@ class Database:
             conn.commit()
             return cursor.lastrowid
 
-    def get_pending_requests(self):
+    def get_pending_requests(self, fields=None, as_json=False):
+        columns = select_columns(PENDING_REQUEST_FIELDS, fields, as_json)
+        query = f'''
+            SELECT {columns}
+            FROM data_requests dr
+            JOIN users u ON dr.user_id = u.id
+            JOIN qr_codes qc ON dr.qr_timestamp = qc.timestamp
+            WHERE dr.status = 'pending'
+            ORDER BY dr.created_at DESC
+        '''
+        if as_json:
+            return self.fetch_json(query)
         with self.connect() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT dr.*, u.username, qc.item_type, qc.lot_number
-                FROM data_requests dr
-                JOIN users u ON dr.user_id = u.id
-                JOIN qr_codes qc ON dr.qr_timestamp = qc.timestamp
-                WHERE dr.status = 'pending'
-                ORDER BY dr.created_at DESC
-            ''')
-            rows = cursor.fetchall()
-            return [{
-                'id': row[0],
-                'qr_timestamp': row[1],
-                'user_id': row[2],
-                'request_type': row[3],
-                'request_data': row[4],
-                'status': row[5],
-                'created_at': row[6],
-                'resolved_at': row[7],
-                'resolved_by': row[8],
-                'username': row[9],
-                'item_type': row[10],
-                'lot_number': row[11]
-            } for row in rows]
+            cursor.execute(query)
+            return fetch_dicts(cursor)
 
     def get_request_by_id(self, request_id):
         with self.connect() as conn:
@@ -253,69 +342,50 @@ class Database:
             conn.commit()
             return True
 
-    def get_inspections_for_qr(self, qr_timestamp):
+    def get_inspections_for_qr(self, qr_timestamp, fields=None, as_json=False):
+        columns = select_columns(QR_INSPECTION_FIELDS, fields, as_json)
+        query = f'SELECT {columns} FROM inspections WHERE qr_timestamp = ? ORDER BY inspection_time DESC'
+        if as_json:
+            return self.fetch_json(query, (qr_timestamp,))
         with self.connect() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT * FROM inspections WHERE qr_timestamp = ? ORDER BY inspection_time DESC', (qr_timestamp,))
-            rows = cursor.fetchall()
-            return [{
-                'id': row[0],
-                'qr_timestamp': row[1],
-                'inspection_time': row[2],
-                'inspection_report': row[3],
-                'need_replacement_repair': row[4],
-                'created_at': row[5]
-            } for row in rows]
-
-    def get_all_qr_codes(self):
+            cursor.execute(query, (qr_timestamp,))
+            return fetch_dicts(cursor)
+
+    def get_all_qr_codes(self, fields=None, as_json=False):
+        columns = select_columns(QR_CODE_FIELDS, fields, as_json)
+        query = f'SELECT {columns} FROM qr_codes ORDER BY timestamp DESC'
+        if as_json:
+            return self.fetch_json(query)
         with self.connect() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT * FROM qr_codes ORDER BY timestamp DESC')
-            rows = cursor.fetchall()
-            return [{
-                'timestamp': row[0],
-                'vendor_name': row[1],
-                'lot_number': row[2],
-                'item_type': row[3],
-                'manufacture_date': row[4],
-                'supply_date': row[5],
-                'warranty_period': row[6],
-                'status': row[7],
-                'created_at': row[8],
-                'qr_file_path': row[9]
-            } for row in rows]
-
-    def get_all_inspections(self):
+            cursor.execute(query)
+            return fetch_dicts(cursor)
+
+    def get_all_inspections(self, fields=None, as_json=False):
+        columns = select_columns(INSPECTION_FIELDS, fields, as_json)
+        query = f'''
+            SELECT {columns}
+            FROM inspections i
+            JOIN qr_codes qc ON i.qr_timestamp = qc.timestamp
+            ORDER BY i.inspection_time DESC
+        '''
+        if as_json:
+            return self.fetch_json(query)
         with self.connect() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT i.*, qc.item_type, qc.lot_number
-                FROM inspections i
-                JOIN qr_codes qc ON i.qr_timestamp = qc.timestamp
-                ORDER BY i.inspection_time DESC
-            ''')
-            rows = cursor.fetchall()
-            return [{
-                'id': row[0],
-                'qr_timestamp': row[1],
-                'inspection_time': row[2],
-                'inspection_report': row[3],
-                'need_replacement_repair': row[4],
-                'item_type': row[7],
-                'lot_number': row[8]
-            } for row in rows]
-
-    def get_all_users(self):
+            cursor.execute(query)
+            return fetch_dicts(cursor)
+
+    def get_all_users(self, fields=None, as_json=False):
+        columns = select_columns(USER_FIELDS, fields, as_json)
+        query = f'SELECT {columns} FROM users ORDER BY username'
+        if as_json:
+            return self.fetch_json(query)
         with self.connect() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT id, username, role, created_at FROM users ORDER BY username')
-            rows = cursor.fetchall()
-            return [{
-                'id': row[0],
-                'username': row[1],
-                'role': row[2],
-                'created_at': row[3]
-            } for row in rows]
+            cursor.execute(query)
+            return fetch_dicts(cursor)
 
     def delete_user(self, user_id):
         with self.connect() as conn:
@@ -0,0 +1,121 @@
+"""
+Benchmark for the list endpoints.
+
+Seeds a temporary database with qr_codes rows and reports CPU time and
+payload size for GET /api/qr-codes, with full and projected rows, across:
+
+  jsonify   - dict rows serialized by Flask's jsonify (the old path)
+  orjson    - dict rows serialized by orjson, when it is installed
+  sqlite    - the endpoint itself: rows encoded by SQLite's json_object()
+
+Also checks that all paths return the same JSON and that an unknown field
+is rejected with a 400.
+
+Usage: python scripts/bench_list_endpoints.py [--rows 100000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'api'))
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+PROJECTED_FIELDS = ['timestamp', 'vendor_name']
+
+
+def seed(db, rows):
+    with db.connect() as conn:
+        conn.executemany('''
+            INSERT INTO qr_codes (
+                timestamp, vendor_name, lot_number, item_type, manufacture_date,
+                supply_date, warranty_period, qr_file_path
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [
+            (i, f'Vendor {i % 50}', f'LOT-{i}', 'ERC', '2024-01-01', '2024-02-01',
+             '2 years', f'static/qr_codes/qr_{i}.png')
+            for i in range(rows)
+        ])
+
+
+def measure(bench):
+    start = time.process_time()
+    body = bench()
+    return time.process_time() - start, body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # app.py creates its own qrix.db in the working directory on import
+        os.chdir(tmp)
+        try:
+            run(tmp, args.rows)
+        finally:
+            os.chdir(ROOT)
+
+
+def run(tmp, rows):
+    import app as app_module
+    from flask import jsonify
+    from db.database import Database
+
+    db = Database(os.path.join(tmp, 'bench.db'))
+    app_module.db = db
+    app = app_module.app
+    client = app.test_client()
+    # Compact output, as jsonify produces outside debug mode
+    app.json.compact = True
+
+    print(f'Seeding {rows} rows...')
+    seed(db, rows)
+
+    cases = [('full', None), ('projected', PROJECTED_FIELDS)]
+    print(f"{'case':<12}{'path':<10}{'cpu (s)':>10}{'bytes':>14}")
+    for label, fields in cases:
+        query = f"?fields={','.join(fields)}" if fields else ''
+
+        def run_jsonify():
+            with app.test_request_context():
+                return jsonify({'success': True, 'data': db.get_all_qr_codes(fields)}).get_data()
+
+        def run_orjson():
+            payload = {'success': True, 'data': db.get_all_qr_codes(fields)}
+            return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+
+        def run_sqlite():
+            return client.get(f'/api/qr-codes{query}').get_data()
+
+        paths = [('jsonify', run_jsonify), ('orjson', run_orjson), ('sqlite', run_sqlite)]
+        reference = None
+        for name, bench in paths:
+            if name == 'orjson' and orjson is None:
+                print(f'{label:<12}{name:<10}{"(not installed)":>24}')
+                continue
+            cpu, body = measure(bench)
+            print(f'{label:<12}{name:<10}{cpu:>10.3f}{len(body):>14}')
+            if reference is None:
+                reference = json.loads(body)
+            elif json.loads(body) != reference:
+                sys.exit(f'{name} returned different JSON for the {label} case')
+
+    response = client.get('/api/users?fields=password')
+    print(f'GET /api/users?fields=password -> {response.status_code}')
+    if response.status_code != 400:
+        sys.exit('unknown field was not rejected')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+import importlib
+import json
+import os
+import sqlite3
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'api'))
+
+from db.database import Database, QR_CODE_FIELDS, USER_FIELDS, select_columns
+
+
+def add_qr_code(db, timestamp, **overrides):
+    row = {
+        'vendor_name': 'Vendor A',
+        'lot_number': f'LOT-{timestamp}',
+        'item_type': 'ERC',
+        'manufacture_date': '2024-01-01',
+        'supply_date': '2024-02-01',
+        'warranty_period': '2 years'
+    }
+    row.update(overrides)
+    with db.connect() as conn:
+        conn.execute('''
+            INSERT INTO qr_codes (
+                timestamp, vendor_name, lot_number, item_type,
+                manufacture_date, supply_date, warranty_period
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (timestamp, row['vendor_name'], row['lot_number'], row['item_type'],
+              row['manufacture_date'], row['supply_date'], row['warranty_period']))
+
+
+@pytest.fixture
+def db(tmp_path):
+    return Database(str(tmp_path / 'test.db'))
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch, db):
+    # app.py creates its own qrix.db in the working directory on import
+    monkeypatch.chdir(tmp_path)
+    app_module = importlib.import_module('app')
+    monkeypatch.setattr(app_module, 'db', db)
+    return app_module.app.test_client()
+
+
+def test_select_columns_defaults_to_all_fields():
+    assert select_columns(USER_FIELDS) == select_columns(USER_FIELDS, [])
+    assert select_columns(USER_FIELDS) == 'created_at AS created_at, id AS id, role AS role, username AS username'
+
+
+def test_select_columns_deduplicates_fields():
+    assert select_columns(USER_FIELDS, ['role', 'id', 'role']) == 'id AS id, role AS role'
+
+
+def test_select_columns_rejects_unknown_fields():
+    with pytest.raises(ValueError, match='password'):
+        select_columns(USER_FIELDS, ['username', 'password'])
+    with pytest.raises(ValueError):
+        select_columns(QR_CODE_FIELDS, ['timestamp FROM users; --'])
+
+
+def test_projection_returns_only_requested_fields(db):
+    add_qr_code(db, 1)
+    assert db.get_all_qr_codes(['vendor_name', 'timestamp']) == [{'timestamp': 1, 'vendor_name': 'Vendor A'}]
+
+
+def test_fetch_json_matches_dict_rows(db):
+    for timestamp in range(1, 2500):
+        add_qr_code(db, timestamp, vendor_name=f'Vendor "{timestamp}"')
+    assert json.loads(db.get_all_qr_codes(as_json=True)) == db.get_all_qr_codes()
+
+
+def test_fetch_json_empty_result(db):
+    assert db.get_all_qr_codes(as_json=True) == '[]'
+
+
+def test_fetch_json_does_not_block_writers(db):
+    for timestamp in range(1, 2500):
+        add_qr_code(db, timestamp)
+    db.get_all_qr_codes(as_json=True)
+    conn = sqlite3.connect(db.db_file, timeout=0)
+    try:
+        conn.execute("UPDATE qr_codes SET status = 'inactive'")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_list_endpoint_matches_jsonify_body(client, db):
+    add_qr_code(db, 1)
+    add_qr_code(db, 2, vendor_name='Vendor B')
+    response = client.get('/api/qr-codes')
+    assert response.status_code == 200
+    with client.application.app_context():
+        expected = client.application.json.dumps({'success': True, 'data': db.get_all_qr_codes()})
+    assert json.loads(response.data) == json.loads(expected)
+    assert list(json.loads(response.data)['data'][0]) == sorted(QR_CODE_FIELDS)
+
+
+def test_list_endpoint_projects_fields(client, db):
+    add_qr_code(db, 1)
+    response = client.get('/api/qr-codes?fields=timestamp, vendor_name,timestamp')
+    assert response.get_json() == {'success': True, 'data': [{'timestamp': 1, 'vendor_name': 'Vendor A'}]}
+
+
+@pytest.mark.parametrize('fields', ['', ' , '])
+def test_list_endpoint_blank_fields_returns_all_columns(client, fields):
+    response = client.get(f'/api/users?fields={fields}')
+    assert response.status_code == 200
+    assert set(response.get_json()['data'][0]) == set(USER_FIELDS)
+
+
+@pytest.mark.parametrize('url', [
+    '/api/users?fields=password',
+    '/api/qr-codes?fields=timestamp,secret',
+    '/api/inspections?fields=x',
+    '/api/requests?fields=x',
+    '/api/qr-codes/1/inspections?fields=x'
+])
+def test_list_endpoint_rejects_unknown_fields(client, url):
+    response = client.get(url)
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False